@@ -1,24 +1,67 @@
 import os
+import io
+import gzip
 import json
+
+# Optional accelerator: the deployment zip ships only this file plus the
+# runtime-provided stdlib/boto3, so fall back to stdlib json when the
+# dependency is not bundled
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 import boto3
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
 import subprocess
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 import re
 import glob
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-lambda_client = boto3.client('lambda')
-secrets_manager = boto3.client('secretsmanager')
-s3_client = boto3.client('s3')
-sns_client = boto3.client('sns')
-sts_client = boto3.client('sts')
-cloudwatch = boto3.client('cloudwatch')
-dynamodb = boto3.resource('dynamodb')
+# Shared client config: larger connection pool so sequential service calls
+# reuse sockets instead of discarding them, adaptive retries, and keep-alive
+_BOTO_CFG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10
+)
+
+# Clients used on every invocation are built eagerly during INIT.
+# STS, SNS and DynamoDB are only needed for cross-account, notification
+# and cache configurations, so they are created lazily on first use
+# (each boto3 client costs ~25ms of cold-start otherwise)
+lambda_client = boto3.client('lambda', config=_BOTO_CFG)
+secrets_manager = boto3.client('secretsmanager', config=_BOTO_CFG)
+s3_client = boto3.client('s3', config=_BOTO_CFG)
+cloudwatch = boto3.client('cloudwatch', config=_BOTO_CFG)
+
+_clients: Dict[str, Any] = {}
+
+
+def _c(name: str) -> Any:
+    """Return a memoized boto3 client created on first use"""
+    if name not in _clients:
+        _clients[name] = boto3.client(name, config=_BOTO_CFG)
+    return _clients[name]
+
 
 QUALYS_SECRET_ARN = os.environ.get('QUALYS_SECRET_ARN')
 RESULTS_S3_BUCKET = os.environ.get('RESULTS_S3_BUCKET')
@@ -42,11 +85,76 @@ if not QSCANNER_PATH:
     logger.error("QSCANNER_PATH is empty, using default /opt/bin/qscanner")
     QSCANNER_PATH = '/opt/bin/qscanner'
 
+# Assumed-role Lambda clients cached across warm invocations,
+# keyed by (role_arn, region) -> (credential expiration, client)
+_ASSUMED_CLIENTS: Dict[Tuple[str, str], Tuple[datetime, Any]] = {}
+
+# Qualys credentials cached across warm invocations: (fetch time, secret)
+_SECRET_CACHE: Optional[Tuple[float, Dict[str, str]]] = None
+_SECRET_TTL = 600
+_REQUIRED_SECRET_FIELDS = frozenset(('qualys_pod', 'qualys_access_token'))
+
+# In-process scan cache: (function_arn, code_sha256) -> scan epoch seconds.
+# Absorbs bursts of EventBridge triggers for the same function without a
+# DynamoDB round-trip per event; evicted FIFO once it reaches max size
+_SCAN_CACHE_LOCAL: Dict[Tuple[str, str], float] = {}
+_SCAN_CACHE_LOCAL_MAX = 512
+
+# QScanner argv template; only the credentials (positions 2 and 4) and the
+# trailing function ARN vary per invocation
+_CMD_TEMPLATE = [
+    QSCANNER_PATH,
+    '--pod', '',
+    '--access-token', '',
+    '--output-dir', '/tmp/qscanner-output',
+    '--cache-dir', '/tmp/qscanner-cache',
+    '--scan-types', 'pkg,secret',
+    'lambda'
+]
+
+# Snapshot of the Lambda environment taken at INIT; run_qscanner layers
+# its per-invocation overrides on top instead of copying os.environ each call
+_BASE_ENV = dict(os.environ)
+
+
+def _prewarm_qscanner() -> None:
+    """Touch the QScanner binary during INIT so the first invocation skips
+    the page-cache miss and dynamic-linker work for the large ELF
+
+    Running --version forces the loader to resolve shared libraries up
+    front; with SnapStart or Provisioned Concurrency this cost is baked
+    into the snapshot. Failures are harmless (e.g. binary absent in
+    local testing) and only logged at DEBUG.
+    """
+    try:
+        with open(QSCANNER_PATH, 'rb') as f:
+            f.read(4096)
+        subprocess.run([QSCANNER_PATH, '--version'], capture_output=True, timeout=5)
+    except Exception as e:
+        logger.debug("QScanner pre-warm skipped: %s", e)
+
+
+_prewarm_qscanner()
+
+# Multipart upload kicks in for results larger than 8MB (compressed)
+_S3_TRANSFER_CFG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    use_threads=True
+)
+
 
 class ScanException(Exception):
     pass
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
 def validate_pod(pod: str) -> bool:
     """Validate Qualys POD name format"""
     return bool(re.match(r'^[A-Z0-9]+$', pod))
@@ -145,13 +253,17 @@ def publish_custom_metrics(metric_data: Dict[str, Any]) -> None:
 
 
 def get_qualys_credentials() -> Dict[str, str]:
+    global _SECRET_CACHE
+
+    if _SECRET_CACHE and time.monotonic() - _SECRET_CACHE[0] < _SECRET_TTL:
+        return _SECRET_CACHE[1]
+
     response = secrets_manager.get_secret_value(SecretId=QUALYS_SECRET_ARN)
     secret = json.loads(response['SecretString'])
 
-    required_fields = ['qualys_pod', 'qualys_access_token']
-    for field in required_fields:
-        if field not in secret:
-            raise ValueError(f"Missing required field: {field}")
+    missing = _REQUIRED_SECRET_FIELDS - secret.keys()
+    if missing:
+        raise ValueError(f"Missing required fields: {sorted(missing)}")
 
     if not validate_pod(secret['qualys_pod']):
         raise ValueError("Invalid POD format")
@@ -160,23 +272,46 @@ def get_qualys_credentials() -> Dict[str, str]:
         raise ValueError("Invalid access token format")
 
     logger.info(f"Retrieved Qualys credentials for pod: {secret['qualys_pod']}")
+    _SECRET_CACHE = (time.monotonic(), secret)
     return secret
 
 
+def _remember_scan(function_arn: str, code_sha256: Optional[str], scan_epoch: float) -> None:
+    """Record a known-scanned (arn, sha) pair in the in-process cache"""
+    if not code_sha256:
+        return
+    if len(_SCAN_CACHE_LOCAL) >= _SCAN_CACHE_LOCAL_MAX:
+        _SCAN_CACHE_LOCAL.pop(next(iter(_SCAN_CACHE_LOCAL)))
+    _SCAN_CACHE_LOCAL[(function_arn, code_sha256)] = scan_epoch
+
+
 def check_scan_cache(function_arn: str, code_sha256: str) -> bool:
     if not SCAN_CACHE_TABLE or not code_sha256:
         return False
 
+    scanned_at = _SCAN_CACHE_LOCAL.get((function_arn, code_sha256))
+    if scanned_at is not None:
+        if time.time() - scanned_at < CACHE_TTL_DAYS * 86400:
+            logger.info(f"Cache hit (in-process): {function_arn} with hash {code_sha256}")
+            return True
+        del _SCAN_CACHE_LOCAL[(function_arn, code_sha256)]
+
     try:
-        table = dynamodb.Table(SCAN_CACHE_TABLE)
-        response = table.get_item(Key={'function_arn': function_arn})
+        # Low-level client: skips the resource-layer attribute marshalling
+        # and fetches only the two attributes the comparison needs
+        response = _c('dynamodb').get_item(
+            TableName=SCAN_CACHE_TABLE,
+            Key={'function_arn': {'S': function_arn}},
+            ProjectionExpression='code_sha256, scan_timestamp',
+            ConsistentRead=False
+        )
 
         if 'Item' not in response:
             return False
 
         item = response['Item']
-        cached_sha256 = item.get('code_sha256')
-        scan_timestamp = item.get('scan_timestamp')
+        cached_sha256 = item.get('code_sha256', {}).get('S')
+        scan_timestamp = item.get('scan_timestamp', {}).get('S')
 
         if cached_sha256 != code_sha256:
             logger.info(f"Code hash changed: {cached_sha256} -> {code_sha256}")
@@ -184,13 +319,18 @@ def check_scan_cache(function_arn: str, code_sha256: str) -> bool:
 
         if scan_timestamp:
             scan_time = datetime.fromisoformat(scan_timestamp)
+            if scan_time.tzinfo is None:
+                # Entries written before timestamps carried an offset are UTC
+                scan_time = scan_time.replace(tzinfo=timezone.utc)
             cache_expiry = scan_time + timedelta(days=CACHE_TTL_DAYS)
 
-            if datetime.utcnow() > cache_expiry:
+            if datetime.now(timezone.utc) > cache_expiry:
                 logger.info(f"Cache expired (scanned {scan_timestamp})")
                 return False
 
         logger.info(f"Cache hit: {function_arn} with hash {code_sha256}")
+        _remember_scan(function_arn, code_sha256,
+                       scan_time.timestamp() if scan_timestamp else time.time())
         return True
 
     except Exception as e:
@@ -203,22 +343,22 @@ def update_scan_cache(function_arn: str, lambda_details: Dict[str, Any], scan_re
         return
 
     try:
-        table = dynamodb.Table(SCAN_CACHE_TABLE)
-        timestamp = datetime.utcnow()
+        timestamp = datetime.now(timezone.utc)
 
-        table.put_item(
-            Item={
-                'function_arn': function_arn,
-                'code_sha256': lambda_details.get('code_sha256'),
-                'scan_timestamp': timestamp.isoformat(),
-                'function_name': lambda_details.get('function_name'),
-                'package_type': lambda_details.get('package_type'),
-                'runtime': lambda_details.get('runtime'),
-                'last_modified': lambda_details.get('last_modified'),
-                'scan_success': scan_results.get('success'),
-                'ttl': int((timestamp + timedelta(days=CACHE_TTL_DAYS)).timestamp())
-            }
-        )
+        item = {
+            'function_arn': {'S': function_arn},
+            'scan_timestamp': {'S': timestamp.isoformat()},
+            'scan_success': {'BOOL': bool(scan_results.get('success'))},
+            'ttl': {'N': str(int((timestamp + timedelta(days=CACHE_TTL_DAYS)).timestamp()))}
+        }
+
+        for attr in ('code_sha256', 'function_name', 'package_type', 'runtime', 'last_modified'):
+            value = lambda_details.get(attr)
+            if value is not None:
+                item[attr] = {'S': str(value)}
+
+        _c('dynamodb').put_item(TableName=SCAN_CACHE_TABLE, Item=item)
+        _remember_scan(function_arn, lambda_details.get('code_sha256'), timestamp.timestamp())
 
         logger.info(f"Updated scan cache for {function_arn}")
 
@@ -226,20 +366,46 @@ def update_scan_cache(function_arn: str, lambda_details: Dict[str, Any], scan_re
         logger.error(f"Failed to update scan cache: {e}")
 
 
+def _get_lambda_client(role_arn: str, region: str) -> Any:
+    """Get a Lambda client for an assumed role, reusing cached credentials
+
+    Clients are cached per (role_arn, region) and reused until ~5 minutes
+    before the STS credentials expire, so warm invocations against the same
+    role skip the AssumeRole round-trip and client construction.
+    """
+    cache_key = (role_arn, region)
+    cached = _ASSUMED_CLIENTS.get(cache_key)
+
+    if cached:
+        expiration, client = cached
+        if datetime.now(timezone.utc) + timedelta(minutes=5) < expiration:
+            logger.info(f"Reusing cached assumed-role client for: {role_arn}")
+            return client
+        del _ASSUMED_CLIENTS[cache_key]
+
+    logger.info(f"Assuming cross-account role: {role_arn}")
+    assumed_role = _c('sts').assume_role(
+        RoleArn=role_arn,
+        RoleSessionName='QScannerSession'
+    )
+
+    credentials = assumed_role['Credentials']
+    client = boto3.client(
+        'lambda',
+        aws_access_key_id=credentials['AccessKeyId'],
+        aws_secret_access_key=credentials['SecretAccessKey'],
+        aws_session_token=credentials['SessionToken'],
+        config=_BOTO_CFG
+    )
+
+    _ASSUMED_CLIENTS[cache_key] = (credentials['Expiration'], client)
+    return client
+
+
 def get_lambda_details(function_arn: str, cross_account_role: Optional[str] = None) -> Dict[str, Any]:
     if cross_account_role:
-        logger.info(f"Assuming cross-account role: {cross_account_role}")
-        assumed_role = sts_client.assume_role(
-            RoleArn=cross_account_role,
-            RoleSessionName='QScannerSession'
-        )
-
-        lambda_client_temp = boto3.client(
-            'lambda',
-            aws_access_key_id=assumed_role['Credentials']['AccessKeyId'],
-            aws_secret_access_key=assumed_role['Credentials']['SecretAccessKey'],
-            aws_session_token=assumed_role['Credentials']['SessionToken']
-        )
+        region = os.environ.get('AWS_REGION', 'us-east-1')
+        lambda_client_temp = _get_lambda_client(cross_account_role, region)
     else:
         lambda_client_temp = lambda_client
 
@@ -292,21 +458,56 @@ def retry_with_backoff(func, max_retries=3, initial_delay=2):
     raise ScanException("Max retries exceeded")
 
 
+def _extract_result_subtrees(results_file: str) -> Dict[str, Any]:
+    """Incrementally parse only the subtrees downstream consumers use
+
+    The SNS summary and vulnerability count read 'vulnerabilities' and
+    RepoTag extraction reads 'Metadata'; the rest of the potentially
+    multi-MB document is only ever copied verbatim into S3, so there is
+    no need to build the full tree in memory.
+    """
+    wanted = ('vulnerabilities', 'Metadata')
+
+    if ijson is None:
+        # Without the incremental parser, fall back to a full parse and
+        # keep only the subtrees; costs memory proportional to the document
+        with open(results_file, 'rb') as f:
+            document = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        return {key: document[key] for key in wanted if key in document}
+
+    subtrees: Dict[str, Any] = {}
+    for key in wanted:
+        with open(results_file, 'rb') as f:
+            # use_float keeps non-integer numbers as floats; ijson's default
+            # Decimal breaks json.dumps of the SNS message downstream
+            for value in ijson.items(f, key, use_float=True):
+                subtrees[key] = value
+                break
+    return subtrees
+
+
+def _drain_stream(stream: Any, tail: deque) -> None:
+    """Consume a subprocess pipe line by line, keeping only the tail
+
+    The deque's maxlen bounds how many lines are retained, so a noisy
+    scanner cannot grow process memory with its progress output.
+    """
+    try:
+        for line in iter(stream.readline, b''):
+            tail.append(line)
+    finally:
+        stream.close()
+
+
 def run_qscanner(function_arn: str, qualys_creds: Dict[str, str], aws_region: str) -> Dict[str, Any]:
     logger.info(f"Starting QScanner for Lambda function: {function_arn}")
 
-    cmd = [
-        QSCANNER_PATH,
-        '--pod', qualys_creds['qualys_pod'],
-        '--access-token', qualys_creds['qualys_access_token'],
-        '--output-dir', '/tmp/qscanner-output',
-        '--cache-dir', '/tmp/qscanner-cache',
-        '--scan-types', 'pkg,secret',
-        'lambda', function_arn
-    ]
+    cmd = list(_CMD_TEMPLATE)
+    cmd[2] = qualys_creds['qualys_pod']
+    cmd[4] = qualys_creds['qualys_access_token']
+    cmd.append(function_arn)
 
-    env = os.environ.copy()
-    env['AWS_REGION'] = aws_region
+    env = _BASE_ENV | {'AWS_REGION': aws_region}
 
     if 'registry_username' in qualys_creds:
         env['QSCANNER_REGISTRY_USERNAME'] = qualys_creds['registry_username']
@@ -315,59 +516,75 @@ def run_qscanner(function_arn: str, qualys_creds: Dict[str, str], aws_region: st
     if 'registry_token' in qualys_creds:
         env['QSCANNER_REGISTRY_TOKEN'] = qualys_creds['registry_token']
 
-    logger.info(f"Executing: {' '.join(cmd[:6])} [credentials hidden] lambda {function_arn}")
+    # Never log the argv itself: positions 2 and 4 hold credentials
+    logger.debug("Executing qscanner lambda %s", function_arn)
+
+    # Drain stdout/stderr into bounded deques instead of buffering the
+    # whole output in memory: QScanner progress output can run to tens
+    # of MB and capture_output=True would hold it all in the process.
+    stdout_tail: deque = deque(maxlen=4096)
+    stderr_tail: deque = deque(maxlen=4096)
+
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    drains = [
+        threading.Thread(target=_drain_stream, args=(proc.stdout, stdout_tail), daemon=True),
+        threading.Thread(target=_drain_stream, args=(proc.stderr, stderr_tail), daemon=True)
+    ]
+    for t in drains:
+        t.start()
 
     try:
-        result = subprocess.run(
-            cmd,
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=SCAN_TIMEOUT
-        )
+        returncode = proc.wait(timeout=SCAN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        logger.error(f"QScanner timed out after {SCAN_TIMEOUT} seconds")
+        raise ScanException(f"Scan timeout after {SCAN_TIMEOUT} seconds")
 
-        if result.returncode != 0:
-            logger.error(f"QScanner failed with exit code {result.returncode}")
-            logger.error(f"STDOUT: {sanitize_log_output(result.stdout)}")
-            logger.error(f"STDERR: {sanitize_log_output(result.stderr)}")
-            raise ScanException("QScanner execution failed")
+    for t in drains:
+        t.join(timeout=5)
 
-        logger.info("QScanner completed successfully")
+    stdout_text = b''.join(stdout_tail).decode('utf-8', 'replace')
+    stderr_text = b''.join(stderr_tail).decode('utf-8', 'replace')
 
-        # Read QScanner output files from /tmp/qscanner-output/
-        scan_results = {}
-        output_dir = '/tmp/qscanner-output'
+    if returncode != 0:
+        logger.error(f"QScanner failed with exit code {returncode}")
+        logger.error(f"STDOUT: {sanitize_log_output(stdout_text[:4096])}")
+        logger.error(f"STDERR: {sanitize_log_output(stderr_text[:4096])}")
+        raise ScanException("QScanner execution failed")
 
-        try:
-            # Look for *-ScanResult.json file
-            import glob
-            scan_result_files = glob.glob(f'{output_dir}/*-ScanResult.json')
+    logger.info("QScanner completed successfully")
 
-            if scan_result_files:
-                scan_result_file = scan_result_files[0]
-                logger.info(f"Reading scan results from: {scan_result_file}")
+    # Read QScanner output files from /tmp/qscanner-output/
+    scan_results = {}
+    results_file = None
+    output_dir = '/tmp/qscanner-output'
 
-                with open(scan_result_file, 'r') as f:
-                    scan_results = json.load(f)
-            else:
-                logger.warning("No ScanResult.json file found in output directory")
-                scan_results = {}
+    try:
+        # Look for *-ScanResult.json file
+        scan_result_files = glob.glob(f'{output_dir}/*-ScanResult.json')
 
-        except Exception as e:
-            logger.warning(f"Failed to read QScanner output files: {e}")
+        if scan_result_files:
+            results_file = scan_result_files[0]
+            logger.info(f"Reading scan results from: {results_file}")
+            scan_results = _extract_result_subtrees(results_file)
+        else:
+            logger.warning("No ScanResult.json file found in output directory")
             scan_results = {}
 
-        return {
-            'success': True,
-            'exit_code': result.returncode,
-            'results': scan_results,
-            'stdout': result.stdout,
-            'stderr': result.stderr
-        }
+    except Exception as e:
+        logger.warning(f"Failed to read QScanner output files: {e}")
+        scan_results = {}
+        results_file = None
 
-    except subprocess.TimeoutExpired:
-        logger.error(f"QScanner timed out after {SCAN_TIMEOUT} seconds")
-        raise ScanException(f"Scan timeout after {SCAN_TIMEOUT} seconds")
+    return {
+        'success': True,
+        'exit_code': returncode,
+        'results': scan_results,
+        'results_file': results_file,
+        'stdout': stdout_text,
+        'stderr': stderr_text
+    }
 
 
 def extract_repo_tags(scan_results: Dict[str, Any], scan_timestamp: str) -> Optional[str]:
@@ -441,58 +658,113 @@ def tag_lambda_function(function_arn: str, repo_tag: Optional[str], scan_timesta
         logger.error(f"Failed to tag Lambda function: {e}")
 
 
+def _put_s3(lambda_details: Dict[str, Any], full_results: Dict[str, Any], epoch_ms: int,
+            results_file: Optional[str] = None) -> None:
+    try:
+        # Short hash prefix spreads keys across S3 partitions so bulk
+        # scanning does not funnel writes into one sequential prefix
+        function_name = lambda_details['function_name']
+        prefix = hashlib.blake2b(function_name.encode(), digest_size=2).hexdigest()
+        key = f"scans/{prefix}/{function_name}/{epoch_ms}.json.gz"
+
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=1) as gz:
+            if results_file:
+                # Splice the raw ScanResult.json straight from disk into the
+                # document as scan_results.results, so the full tree is never
+                # materialized in memory. Each member is serialized
+                # explicitly so the output cannot depend on the
+                # serializer's key order or brace placement
+                gz.write(b'{')
+                for k, v in full_results.items():
+                    if k == 'scan_results':
+                        continue
+                    gz.write(_json_dumps(k) + b':' + _json_dumps(v) + b',')
+                gz.write(b'"scan_results":{')
+                for k, v in full_results['scan_results'].items():
+                    if k == 'results':
+                        continue
+                    gz.write(_json_dumps(k) + b':' + _json_dumps(v) + b',')
+                gz.write(b'"results":')
+                with open(results_file, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                        gz.write(chunk)
+                gz.write(b'}}')
+            else:
+                gz.write(_json_dumps(full_results))
+        buf.seek(0)
+
+        s3_client.upload_fileobj(
+            buf,
+            Bucket=RESULTS_S3_BUCKET,
+            Key=key,
+            ExtraArgs={
+                'ContentType': 'application/json',
+                'ContentEncoding': 'gzip',
+                'ServerSideEncryption': 'AES256'
+            },
+            Config=_S3_TRANSFER_CFG
+        )
+        logger.info(f"Stored results in S3: s3://{RESULTS_S3_BUCKET}/{key}")
+    except Exception as e:
+        logger.error(f"Failed to store results in S3: {e}")
+
+
+def _publish_sns(lambda_details: Dict[str, Any], scan_results: Dict[str, Any], timestamp: str) -> None:
+    try:
+        message = {
+            'function_name': lambda_details['function_name'],
+            'function_arn': lambda_details['function_arn'],
+            'scan_timestamp': timestamp,
+            'scan_success': scan_results['success'],
+            'image_uri': lambda_details.get('image_uri', 'N/A')
+        }
+
+        if 'results' in scan_results and isinstance(scan_results['results'], dict):
+            vuln_summary = scan_results['results'].get('vulnerabilities', {})
+            message['vulnerability_summary'] = vuln_summary
+
+        _c('sns').publish(
+            TopicArn=SNS_TOPIC_ARN,
+            Subject=f"QScanner Results: {lambda_details['function_name']}",
+            Message=json.dumps(message, separators=(',', ':'))
+        )
+        logger.info(f"Sent notification to SNS: {SNS_TOPIC_ARN}")
+    except Exception as e:
+        logger.error(f"Failed to send SNS notification: {e}")
+
+
 def store_results(lambda_details: Dict[str, Any], scan_results: Dict[str, Any]) -> None:
-    timestamp = datetime.utcnow().isoformat()
+    now = datetime.now(timezone.utc)
+    timestamp = now.isoformat()
+    epoch_ms = int(now.timestamp() * 1000)
 
+    results_file = scan_results.get('results_file')
     full_results = {
         'scan_timestamp': timestamp,
         'lambda_function': lambda_details,
-        'scan_results': scan_results
+        'scan_results': {k: v for k, v in scan_results.items() if k != 'results_file'}
     }
 
-    if RESULTS_S3_BUCKET:
-        try:
-            key = f"scans/{lambda_details['function_name']}/{timestamp}.json"
-            s3_client.put_object(
-                Bucket=RESULTS_S3_BUCKET,
-                Key=key,
-                Body=json.dumps(full_results, indent=2),
-                ContentType='application/json',
-                ServerSideEncryption='AES256'
-            )
-            logger.info(f"Stored results in S3: s3://{RESULTS_S3_BUCKET}/{key}")
-        except Exception as e:
-            logger.error(f"Failed to store results in S3: {e}")
-
-    if SNS_TOPIC_ARN:
-        try:
-            message = {
-                'function_name': lambda_details['function_name'],
-                'function_arn': lambda_details['function_arn'],
-                'scan_timestamp': timestamp,
-                'scan_success': scan_results['success'],
-                'image_uri': lambda_details.get('image_uri', 'N/A')
-            }
-
-            if 'results' in scan_results and isinstance(scan_results['results'], dict):
-                vuln_summary = scan_results['results'].get('vulnerabilities', {})
-                message['vulnerability_summary'] = vuln_summary
-
-            sns_client.publish(
-                TopicArn=SNS_TOPIC_ARN,
-                Subject=f"QScanner Results: {lambda_details['function_name']}",
-                Message=json.dumps(message, indent=2)
-            )
-            logger.info(f"Sent notification to SNS: {SNS_TOPIC_ARN}")
-        except Exception as e:
-            logger.error(f"Failed to send SNS notification: {e}")
+    # The S3 upload and SNS publish are independent network calls;
+    # run them concurrently so wall time is max() rather than sum()
+    futures = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if RESULTS_S3_BUCKET:
+            futures.append(executor.submit(_put_s3, lambda_details, full_results, epoch_ms, results_file))
+        if SNS_TOPIC_ARN:
+            futures.append(executor.submit(_publish_sns, lambda_details, scan_results, timestamp))
+        wait(futures)
 
     repo_tag = extract_repo_tags(scan_results, timestamp)
     tag_lambda_function(lambda_details['function_arn'], repo_tag, timestamp, scan_results['success'])
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-    logger.info(f"Received event from source: {event.get('source')}, detail-type: {event.get('detail-type')}")
+    logger.info("Received event from source: %s, detail-type: %s",
+                event.get('source'), event.get('detail-type'))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
 
     try:
         if 'detail' not in event:
@@ -563,8 +835,17 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         scan_results = run_qscanner(function_arn, qualys_creds, aws_region)
         scan_duration = time.time() - scan_start_time
 
-        update_scan_cache(function_arn, lambda_details, scan_results)
-        store_results(lambda_details, scan_results)
+        # The cache update and result dispatch don't depend on each other,
+        # so overlap their network calls instead of serializing them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dispatch = [
+                executor.submit(update_scan_cache, function_arn, lambda_details, scan_results),
+                executor.submit(store_results, lambda_details, scan_results)
+            ]
+            for future in wait(dispatch).done:
+                exc = future.exception()
+                if exc:
+                    logger.error(f"Result dispatch task failed: {exc}")
 
         # Extract vulnerability count if available
         vuln_count = 0